@@ -16,6 +16,8 @@
 
 from __future__ import print_function
 
+from itertools import chain
+
 from dynamic_graph.tracer_real_time import TracerRealTime
 from dynamic_graph.tools import addTrace
 from dynamic_graph.sot.core import OpPointModifier
@@ -27,8 +29,13 @@ from dynamic_graph.sot.dynamics import AngleEstimator
 
 from dynamic_graph import plug
 
-I3 = reduce(lambda m, i: m + (i*(0.,)+(1.,)+ (2-i)*(0.,),), range(3), ())
-I4 = reduce(lambda m, i: m + (i*(0.,)+(1.,)+ (3-i)*(0.,),), range(4), ())
+I3 = ((1., 0., 0.),
+      (0., 1., 0.),
+      (0., 0., 1.))
+I4 = ((1., 0., 0., 0.),
+      (0., 1., 0., 0.),
+      (0., 0., 1., 0.),
+      (0., 0., 0., 1.))
 
 class AbstractHumanoidRobot (object):
     """
@@ -39,7 +46,7 @@ class AbstractHumanoidRobot (object):
       - zmpFromForces: to compute ZMP force foot force sensors,
       - stabilizer: to stabilize balanced motions
 
-    Operational points are stored into 'OperationalPoints' list. Some of them
+    Operational points are stored into 'OperationalPoints' tuple. Some of them
     are also accessible directly as attributes:
       - leftWrist,
       - rightWrist,
@@ -62,9 +69,9 @@ class AbstractHumanoidRobot (object):
 
 
 
-    OperationalPoints = ['left-wrist', 'right-wrist',
+    OperationalPoints = ('left-wrist', 'right-wrist',
                          'left-ankle', 'right-ankle',
-                         'gaze']
+                         'gaze')
     """
     Operational points are specific interesting points of the robot
     used to control it.
@@ -77,7 +84,7 @@ class AbstractHumanoidRobot (object):
     "Jleft-wrist" for respectively the position and the jacobian.
     """
 
-    AdditionalFrames = []
+    AdditionalFrames = ()
     """
     Additional frames are frames which are defined w.r.t an operational point
     and provides an interesting transformation.
@@ -91,12 +98,6 @@ class AbstractHumanoidRobot (object):
     """
 
 
-
-    frames = dict()
-    """
-    Additional frames defined by using OpPointModifier.
-    """
-
     #FIXME: the following options are /not/ independent.
     # zmp requires acceleration which requires velocity.
     """
@@ -126,14 +127,6 @@ class AbstractHumanoidRobot (object):
     """
     tracerSize = 2**20
 
-    """
-    Automatically recomputed signals through the use
-    of device.after.
-    This list is maintained in order to clean the
-    signal list device.after before exiting.
-    """
-    autoRecomputedSignals = []
-
     """
     Which signals should be traced.
     """
@@ -209,10 +202,6 @@ class AbstractHumanoidRobot (object):
             model.setProperty('ComputeMomentum', 'true')
 
 
-    def initializeOpPoints(self, model):
-        for op in self.OperationalPoints:
-            model.createOpPoint(op, op)
-
     def createFrame(self, frameName, transformation, operationalPoint):
         frame = OpPointModifier(frameName)
         frame.setTransformation(transformation)
@@ -238,7 +227,7 @@ class AbstractHumanoidRobot (object):
             raise RunTimeError("robots models have to be initialized first")
 
         if not self.device:
-            self.device = RobotSimu(self.name + '_device')
+            self.device = RobotSimu('{0}_device'.format(self.name))
 
 
         # Freeflyer reference frame should be the same as global
@@ -247,16 +236,19 @@ class AbstractHumanoidRobot (object):
         self.device.set(self.halfSitting)
         plug(self.device.state, self.dynamic.position)
 
+        # Null vector shared by the velocity and acceleration defaults.
+        zero = self.dimension*(0.,)
+
         if self.enableVelocityDerivator:
             self.velocityDerivator = Derivator_of_Vector('velocityDerivator')
             self.velocityDerivator.dt.value = self.timeStep
             plug(self.device.state, self.velocityDerivator.sin)
             plug(self.velocityDerivator.sout, self.dynamic.velocity)
         elif self.plugVelocityFromDevice:
-            self.device.setVelocity(self.dimension*(0.,))
+            self.device.setVelocity(zero)
             plug(self.device.velocity, self.dynamic.velocity)
         else:
-            self.dynamic.velocity.value = self.dimension*(0.,)
+            self.dynamic.velocity.value = zero
 
         if self.enableAccelerationDerivator:
             self.accelerationDerivator = \
@@ -266,12 +258,12 @@ class AbstractHumanoidRobot (object):
                  self.accelerationDerivator.sin)
             plug(self.accelerationDerivator.sout, self.dynamic.acceleration)
         else:
-            self.dynamic.acceleration.value = self.dimension*(0.,)
+            self.dynamic.acceleration.value = zero
 
-        self.initializeOpPoints(self.dynamic)
+        for op in self.OperationalPoints:
+            self.dynamic.createOpPoint(op, op)
 
         # --- additional frames ---
-        self.frames = dict()
         frameName = 'rightHand'
         self.frames [frameName] = self.createFrame (
             "{0}_{1}".format (self.name, frameName),
@@ -308,7 +300,7 @@ class AbstractHumanoidRobot (object):
 
     def traceDefaultSignals (self):
         # Geometry / operational points
-        for s in self.OperationalPoints + self.tracedSignals['dynamic']:
+        for s in chain(self.OperationalPoints, self.tracedSignals['dynamic']):
             self.addTrace(self.dynamic.name, s)
 
         # Geometry / frames
@@ -332,6 +324,15 @@ class AbstractHumanoidRobot (object):
     def __init__(self, name, tracer = None):
         self.name = name
 
+        # Additional frames defined by using OpPointModifier.
+        self.frames = {}
+
+        # Automatically recomputed signals through the use
+        # of device.after.
+        # This list is maintained in order to clean the
+        # signal list device.after before exiting.
+        self.autoRecomputedSignals = []
+
         # Initialize tracer if necessary.
         if tracer:
             self.tracer = tracer
@@ -373,13 +374,24 @@ class AbstractHumanoidRobot (object):
         if not posture:
             posture = self.halfSitting
         self.device.set(posture)
+        self.recomputeDynamics(self.device.state.time + 1)
+
+    def recomputeDynamics(self, time):
+        """
+        Recompute the center of mass, the operational points and
+        their jacobians at the given time.
+
+        Each point is recomputed right before its jacobian so that
+        both queries are made on the same kinematic state.
+        """
+        dynamic = self.dynamic
 
-        self.dynamic.com.recompute(self.device.state.time+1)
-        self.dynamic.Jcom.recompute(self.device.state.time+1)
+        dynamic.com.recompute(time)
+        dynamic.Jcom.recompute(time)
 
         for op in self.OperationalPoints:
-            self.dynamic.signal(op).recompute(self.device.state.time+1)
-            self.dynamic.signal('J'+op).recompute(self.device.state.time+1)
+            dynamic.signal(op).recompute(time)
+            dynamic.signal('J' + op).recompute(time)
 
 class HumanoidRobot(AbstractHumanoidRobot):
 
@@ -392,7 +404,8 @@ class HumanoidRobot(AbstractHumanoidRobot):
         AbstractHumanoidRobot.__init__(self, name, tracer)
         self.filename = filename
         self.dynamic = \
-            self.loadModelFromKxml (self.name + '_dynamics', self.filename)
+            self.loadModelFromKxml ('{0}_dynamics'.format(self.name),
+                                   self.filename)
         self.dimension = self.dynamic.getDimension()
         self.halfSitting = self.dimension*(0.,)
         self.initializeRobot()